@@ -79,41 +79,52 @@ std_strt_timestamp = time.monotonic()
 
 import argparse
 import ast
+import asyncio   # for probe_all()
 # UNUSED: import base64
 import click
 # import boto3  # for aws python
 # UNUSED: from collections import OrderedDict
-from collections import defaultdict
+from collections import Counter, defaultdict
+from collections.abc import Mapping   # base of EnvironmentInfo
+import functools   # for lru_cache
 import gc
 import hashlib
+from heapq import nlargest     # top-N without a full sort
 # UNUSED: import http.client
-import importlib.util
+# UNUSED: import importlib.util
 import inspect
 import io
+from ipaddress import ip_address   # for _is_local_ip()
 import json
+import mmap        # for _extract_dunder_variables()
 # UNUSED: import logging   # see https://realpython.com/python-logging/
 # UNUSED: import math
+from operator import itemgetter
 import os
 import pathlib
 from pathlib import Path
 import platform # https://docs.python.org/3/library/platform.html
 import pwd                # https://www.geeksforgeeks.org/pwd-module-in-python/
-# UNUSED: import random
+import random             # for sampled memory profiles
+import re                 # for is_number()
 import resource
 import secrets
+import shlex      # to run commands without a shell
 import site
-import shutil     # for disk space calcs
+# UNUSED: import shutil     # get_disk_free() uses os.statvfs()
 import smtplib
 import socket
 import string
 import subprocess
 import sys
+from types import MappingProxyType   # read-only view of constant dicts
 from typing import Dict, Any
 # UNUSED: import urllib.request
 # UNUSED: from urllib import request
 # UNUSED: from urllib import parse
 # UNUSED: from urllib import error
 # UNUSED: import uuid
+import weakref   # proxy types skipped by get_all_objects_by_type()
 std_stop_timestamp = time.monotonic()
 
 
@@ -127,26 +138,20 @@ try:
     from cryptography.fernet import Fernet    # pip install cryptography
     from cryptography.hazmat.primitives import serialization     # uv pip install cryptography
     from cryptography.hazmat.primitives.asymmetric import rsa    # uv pip install cryptography
+    from cryptography.hazmat.primitives.asymmetric import ec, ed25519   # for generate_keypair()
     from contextlib import redirect_stdout
     from dotenv import load_dotenv   # install python-dotenv
     from email.mime.text import MIMEText
-    import keyring   # on macOS
-
-    from opentelemetry import trace
-    from opentelemetry.sdk.trace import TracerProvider
-    from opentelemetry.sdk.trace.export import ConsoleSpanExporter, SimpleSpanProcessor
+    # LAZY: keyring, opentelemetry, pyAesCrypt, qrcode, requests are imported
+    # inside the functions using them, so importing myutils stays fast.
 
     # UNUSED: import pandas as pd
-    from pathlib import Path
     import psutil      #  psutil-5.9.5
     # UNUSED: from pythonping import ping
-    import pyAesCrypt            # pip install pyAesCrypt
     # UNUSED: import pytz   # time zones
-    import qrcode
-    import requests
     # UNUSED: import statsd
     # UNUSED: from tabulate import tabulate
-    import tracemalloc
+    # LAZY: tracemalloc is imported by trace_memory_usage(), its only user.
 except Exception as e:
     print(f"Python module import failed: {e}")
     # pyproject.toml file exists
@@ -154,6 +159,17 @@ except Exception as e:
     print("Please activate your virtual environment:\n  python3 -m venv venv && source .venv/bin/activate")
     exit(9)
 
+# Optional faster JSON (uv pip install orjson); falls back to stdlib json if not installed:
+try:
+    import orjson
+    _json_loads = orjson.loads
+    def _json_dumps(obj, sort_keys=False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | (orjson.OPT_SORT_KEYS if sort_keys else 0))
+except ImportError:
+    _json_loads = json.loads
+    def _json_dumps(obj, sort_keys=False) -> bytes:
+        return json.dumps(obj, indent=2, sort_keys=sort_keys).encode()
+
 # For wall time of xpt imports:
 xpt_stop_timestamp =  time.monotonic()
 
@@ -166,9 +182,13 @@ xpt_stop_timestamp =  time.monotonic()
 
 #### SECTION 05: Capture starting memory usage:
 
+# One psutil handle on this process, reused by every memory reading below
+# (psutil.Process() for our own pid cannot raise NoSuchProcess):
+_PROC = psutil.Process()
+
 def memory_used() -> float:
     #import os, psutil  #  psutil-5.9.5
-    process = psutil.Process()
+    process = _PROC
     mem=process.memory_info().rss / (1024 ** 2)  # in bytes
     print(str(process))
     print("memory used()="+str(mem)+" MiB")
@@ -226,24 +246,24 @@ def get_user_local_timestamp(format_str: str ="yymmddhhmm") -> str:
 # TODO: Google lasStepTimestamp": "2025-06-07T23:51:54.757-07:00",
 
 
+# Local time format of file timestamps from filetimestamp(), mtimestamp() and ctimestamp():
+_FILE_TIMESTAMP_FMT = "%Y-%m-%d-%H:%M"
+
 def filetimestamp(fileName):
     """
     USAGE: print(f"File last modified: {myutils.filetimestamp("myutils.py")} ")
     # TODO: Add time zone info. 📢
     """
-    created = os.path.getmtime(fileName)
-    modified = os.path.getctime(fileName)
-    if created == modified:
-        return f"{ctimestamp(fileName)}"
-    else:
-        return f"{mtimestamp(fileName)}"
+    st = os.stat(fileName)   # one stat() for both times, rather than one per getmtime/getctime
+    t = st.st_ctime if st.st_mtime == st.st_ctime else st.st_mtime
+    return time.strftime(_FILE_TIMESTAMP_FMT, time.localtime(t))
 
 def mtimestamp(fileName):
     """
     USAGE: print(f"File last modified: {myutils.mtimestamp("myutils.py")} ")
     """
     t = os.path.getmtime(fileName)
-    return datetime.fromtimestamp(t).strftime("%Y-%m-%d-%H:%M")
+    return time.strftime(_FILE_TIMESTAMP_FMT, time.localtime(t))   # no datetime object needed
 
 def ctimestamp(fileName):
     """
@@ -251,31 +271,46 @@ def ctimestamp(fileName):
     Fixed datetime import issue
     """
     t = os.path.getctime(fileName)
-    # Use the imported datetime class correctly
-    return datetime.fromtimestamp(t).strftime("%Y-%m-%d-%H:%M")
+    return time.strftime(_FILE_TIMESTAMP_FMT, time.localtime(t))
 
-def list_files(basePath,validExts=None,contains=None):
+def list_files(basePath,validExts=None,contains=None,realpath=False):
     """
-    USAGE: print(myutils.list_files("./"))
-    List files in a directory with optional filters.
+    USAGE: print(list(myutils.list_files("./")))
+    List files in a directory (and its subdirectories) with optional filters.
+    Uses os.scandir(), whose DirEntry objects carry the path and file type,
+    so no extra stat or path join is needed per file.
     Args:
         basePath: Base directory to search for files
-        validExts: Optional tuple of valid file extensions
+        validExts: Optional str or tuple of valid file extensions, such as (".py", ".md")
         contains: Optional string to filter file names
+        realpath: True to resolve symlinks in each path yielded (costs a syscall per file)
     Yields:
-        File paths that match the filters
+        Absolute file paths that match the filters
     """
-    for rootDir, dirNames, fileNames in os.walk(basePath):
-        for fileName in fileNames:
-            if contains is not None and fileName.find(contains) == -1:
+    # Kept as pure Python (not a Cython .pyx): time here goes to the scandir syscalls,
+    # and myutils is a single module copied beside programs, with no build step.
+    try:
+        entries = os.scandir(os.path.abspath(basePath))
+    except OSError:   # Unreadable directories are skipped, as os.walk() does.
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir():
+                if not entry.is_symlink():   # Like os.walk(), do not follow links to folders.
+                    yield from list_files(entry.path, validExts, contains, realpath)
                 continue
-            # reverse find the "." from back wards
-            ext = fileName[fileName.rfind("."):]
-            if validExts is None or ext.endswith(validExts):
-                file = os.path.realpath(os.path.join(rootDir,fileName))
-                yield file
+            if contains is not None and contains not in entry.name:
+                continue
+            if validExts is None or entry.name.endswith(validExts):
+                yield os.path.realpath(entry.path) if realpath else entry.path
 
 RUNID = get_user_local_timestamp()  # "yymmddhhmm"
+# Paths of this module and of the running script never change during the process,
+# so they are resolved once here and read as attributes afterwards:
+_SELF_PATH = Path(__file__).resolve()
+_SELF_NAME = _SELF_PATH.name
+_SELF_STEM = _SELF_PATH.stem
+_ARGV0_PATH = Path(sys.argv[0]).resolve()
 PROGRAM_NAME = os.path.basename(os.path.normpath(sys.argv[0]))
 global_env_path = None
 
@@ -305,6 +340,11 @@ class bcolors:  # ANSI escape sequences: https://gist.github.com/JBlond/2fea43a3
 
     RESET = '\033[0m'   # switch back to default color
 
+    # Combinations built once here rather than concatenated on each print_* call:
+    INFO_BOLD = INFO + BOLD
+    HEADING_UL = HEADING + UNDERLINE
+    RESET_NL = RESET + '\n'
+
 # Starting settings:
 show_secrets = False   # Always False to not show
 show_heading = True    # -q  Don't display step headings before attempting actions
@@ -322,79 +362,111 @@ print_prefix = "***"
 
 SHOW_SUMMARY_COUNTS = True
 
+# Same line boundaries str.splitlines() splits on, deleted in one C-level pass:
+_NEWLINE_TABLE = str.maketrans("", "", "\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029")
+
 def no_newlines(in_string):
     """Strip new line from in_string
     """
-    return ''.join(in_string.splitlines())
+    if isinstance(in_string, (bytes, bytearray)):
+        # bytes.splitlines() only splits on \n and \r:
+        return in_string.translate(None, b"\r\n")
+    return in_string.translate(_NEWLINE_TABLE)
 
 def print_separator():
     """A function to put a blank line in CLI output. Used in case the technique changes throughout this code.
     """
     print(" ")
 
-def print_heading(text_in):
+def _log_lines(emoji: str, color: str, lines) -> str:
+    """Return each of lines in the print_* layout (emoji, optional log date, color, text, reset),
+    joined into one string so a helper can emit it with a single sys.stdout.write().
+    """
+    log_date = get_log_datetime() if show_dates_in_logs else ""
+    prefix = f"{emoji}{log_date}{color} "
+    suffix = f" {bcolors.RESET_NL}"
+    return "".join(f"{prefix}{line}{suffix}" for line in lines)
+
+# Each print_* helper builds its whole line, then makes one sys.stdout.write() call:
+# No stdout reconfigure is needed for batching: when stdout is a file or pipe (not a tty),
+# Python already block-buffers it and flushes at exit; only a tty is line-buffered,
+# and `python -u` / PYTHONUNBUFFERED are explicit requests to keep unbuffered.
+def print_heading(text_in, *args):
     if show_heading:
+        if args:   # %-format only when the line is shown
+            text_in = text_in % args
         # Backhand Index Pointing Down Emoji highlights content below was approved as part of Unicode 6.0 in 2010 under the name "White Down Pointing Backhand Index" and added to Emoji 1.0 in 2015.
-        print("👇", end="")
-        if show_dates_in_logs:
-            print(get_log_datetime(), end="")
-        print(bcolors.HEADING+bcolors.UNDERLINE,f'{text_in}', bcolors.RESET)
+        sys.stdout.write(_log_lines("👇", bcolors.HEADING_UL, (text_in,)))
 
-def print_fail(text_in):  # when program should stop
+def print_fail(text_in, *args):  # when program should stop
     if show_fail:  # typically a programming error.
+        if args:   # %-format only when the line is shown
+            text_in = text_in % args
         # The ⛔ No Entry (Stop sign) Emoji indicates forbidden. approved as part of Unicode 5.2 in 2009 and added to Emoji 1.0 in 2015.
-        print("❌", end="")
-        if show_dates_in_logs:
-            print(get_log_datetime(), end="")
-        print(bcolors.FAIL, f'{text_in}', bcolors.RESET)
+        sys.stdout.write(_log_lines("❌", bcolors.FAIL, (text_in,)))
         # PROTIP: For easier debugging, use a program exit command at point of failure rather than here.
 
-def print_error(text_in):  # when a programming error is evident
+def print_error(text_in, *args):  # when a programming error is evident
     if show_fail:
-        print("⭕", end="")
-        if show_dates_in_logs:
-            print(get_log_datetime(), end="")
-        print(bcolors.ERROR, f'{text_in}', bcolors.RESET)
+        if args:   # %-format only when the line is shown
+            text_in = text_in % args
+        sys.stdout.write(_log_lines("⭕", bcolors.ERROR, (text_in,)))
 
-def print_warning(text_in):
+def print_warning(text_in, *args):
     if show_warning:
-        print("⚠️", end="")
-        if show_dates_in_logs:
-            print(get_log_datetime(), end="")
-        print(bcolors.WARNING, f'{text_in}', bcolors.RESET)
+        if args:   # %-format only when the line is shown
+            text_in = text_in % args
+        sys.stdout.write(_log_lines("⚠️", bcolors.WARNING, (text_in,)))
 
-def print_todo(text_in):
+def print_todo(text_in, *args):
     if show_todo:
+        if args:   # %-format only when the line is shown
+            text_in = text_in % args
         # The 🛠️ hammer and wrench emoji is commonly used for various content concerning tools, building, construction, and work, both manual and digital
-        print("💡", end="")
-        if show_dates_in_logs:
-            print(get_log_datetime(),  end="")
-        print(bcolors.TODO, f'{text_in}', bcolors.RESET)
+        sys.stdout.write(_log_lines("💡", bcolors.TODO, (text_in,)))
 
-def print_info(text_in):
+def print_info(text_in, *args):
     if show_info:
+        if args:   # %-format only when the line is shown
+            text_in = text_in % args
         # Alternately: print("👍", end="")
-        print("✅", end="")
-        if show_dates_in_logs:
-            print(get_log_datetime(), end="")
-        print(bcolors.INFO+bcolors.BOLD, f'{text_in}', bcolors.RESET)
+        sys.stdout.write(_log_lines("✅", bcolors.INFO_BOLD, (text_in,)))
+
+def print_info_lines(lines) -> None:
+    """Like print_info() for each of lines (already formatted), written all at once."""
+    if show_info:
+        sys.stdout.write(_log_lines("✅", bcolors.INFO_BOLD, lines))
 
-def print_verbose(text_in):
+def print_verbose(text_in, *args):
     if show_verbose:
+        if args:   # %-format only when the line is shown
+            text_in = text_in % args
         # The 📣 speaker emoji is used to represent sound, noise, or speech.
-        print("📢", end="")
-        if show_dates_in_logs:
-            print(get_log_datetime(), end="")
-        print(bcolors.VERBOSE, f'{text_in}', bcolors.RESET)
+        sys.stdout.write(_log_lines("📢", bcolors.VERBOSE, (text_in,)))
+
+def print_verbose_lines(lines) -> None:
+    """Like print_verbose() for each of lines (already formatted), written all at once."""
+    if show_verbose:
+        sys.stdout.write(_log_lines("📢", bcolors.VERBOSE, lines))
 
-def print_trace(text_in):  # displayed as each object is created in pgm:
+def print_trace(text_in, *args):  # displayed as each object is created in pgm:
     if show_trace:
+        if args:   # %-format only when the line is shown
+            text_in = text_in % args
         # The 🔍 magnifying glass is a classic for searching, looking, inspecting, approved as part of Unicode 6.0 in 2010 under the name "Left-Pointing Magnifying Glass" and added to Emoji 1.0 in 2015.
-        print("⚙️", end="")
-        if show_dates_in_logs:
-            print(get_log_datetime(), end="")
         # The fingerprint emoji was approved as part of Unicode 16.0 in 2024 and added to Emoji 16.0 in 2024.
-        print(bcolors.TRACE, f'{text_in}', bcolors.RESET)
+        sys.stdout.write(_log_lines("⚙️", bcolors.TRACE, (text_in,)))
+
+def print_trace_lines(lines) -> None:
+    """Like print_trace() for each of lines (already formatted), written all at once."""
+    if show_trace:
+        sys.stdout.write(_log_lines("⚙️", bcolors.TRACE, lines))
+
+def is_verbose() -> bool:
+    """Return True if print_verbose() output is shown,
+    so callers can skip building costly messages when it is not.
+    """
+    return show_verbose
 
 def print_secret(secret_in: str) -> None:
     """ Outputs secrets discreetly - display only the first few characters (like Git) with dots replacing the rest.
@@ -435,12 +507,20 @@ def show_print_samples() -> None:
     return None
 
 
+# Picked once at import rather than re-checking os.name on every clear:
+_CLEAR_CMD = 'cls' if os.name in ('nt', 'dos') else 'clear'
+_ANSI_CLEAR = "\x1b[2J\x1b[H"  # Erase display, then cursor home.
+
+
 def do_clear_cli() -> None:
     """Clear the CLI screen."""
-    print_trace(f"At {sys._getframe().f_code.co_name}()")
-    # import os
-    # QUESTION: What's the output variable?
-    lambda: os.system('cls' if os.name in ('nt', 'dos') else 'clear')
+    print_trace("At do_clear_cli()")
+    if sys.stdout.isatty() and os.name not in ('nt', 'dos'):
+        # ANSI escape avoids a fork+exec of /usr/bin/clear:
+        sys.stdout.write(_ANSI_CLEAR)
+        sys.stdout.flush()
+    else:
+        os.system(_CLEAR_CMD)
     return None
 
 
@@ -464,12 +544,12 @@ def open_env_file(global_env_path: str = None) -> str:
     # PROTIP: Check if .env file on global_env_path is readable:
     if not os.path.isfile(global_env_path):
         global_env_path = None
-        print_error(f"{sys._getframe().f_code.co_name}(): global_env_path: not at \"{global_env_path}\" ")
+        print_error(f"open_env_file(): global_env_path: not at \"{global_env_path}\" ")
         return None
 
     # import pathlib
     #path = pathlib.Path(global_env_path)
-    #print_info(f"{sys._getframe().f_code.co_name}(): path: \"{path}\" ")
+    #print_info(f"open_env_file(): path: \"{path}\" ")
 
     # Based on: pip3 install python-dotenv
     # from dotenv import load_dotenv
@@ -477,7 +557,7 @@ def open_env_file(global_env_path: str = None) -> str:
     # See https://pypi.org/project/python-dotenv/
     load_dotenv(global_env_path)  # using load_dotenv
     # Wait until variables for print_trace are retrieved:
-    print_info(f"{sys._getframe().f_code.co_name}(): at global_env_path: \"{global_env_path}\" ")
+    print_info(f"open_env_file(): at global_env_path: \"{global_env_path}\" ")
     return global_env_path
 
 
@@ -487,10 +567,10 @@ def get_str_from_env_file(key_in) -> bool:
     """
     env_value = os.environ.get(key_in)  # TODO
     if not env_value:  # yes, defined=True, use it:
-        print_trace(f"{sys._getframe().f_code.co_name}(): \"{key_in}\") not found in .env file.")
+        print_trace(f"get_str_from_env_file(): \"{key_in}\") not found in .env file.")
         return None
 
-    print_info(f"{sys._getframe().f_code.co_name}(): {key_in}: \"{env_value}\" ")
+    print_info(f"get_str_from_env_file(): {key_in}: \"{env_value}\" ")
     
 #        # PROTIP: Display only first characters of a potentially secret long string:
 #        if len(env_var) > 5:
@@ -503,13 +583,12 @@ def get_str_from_env_file(key_in) -> bool:
 
 
 def print_env_vars():
-    """List all environment variables, one line each using pretty print (pprint)
+    """List all environment variables, one line each, sorted by name.
     """
-    # import os
-    # import pprint
-    environ_vars = os.environ
     print_heading("User's Environment variable:")
-    print.pprint(dict(environ_vars), width = 1)
+    # One joined write instead of pprint, which recursed and sorted in pure Python
+    # (and print.pprint raised AttributeError):
+    sys.stdout.write('\n'.join(f"{k} = {v}" for k, v in sorted(os.environ.items())) + '\n')
 
 
 def update_env_file(file_path, key, new_value):
@@ -530,7 +609,7 @@ def update_env_file(file_path, key, new_value):
         with open(file_path, 'r') as file:
             lines = file.readlines()
     except FileNotFoundError:
-        print_error(f"{sys._getframe().f_code.co_name}(): File \"{file_path}\" not found.")
+        print_error(f"update_env_file(): File \"{file_path}\" not found.")
         return False
     
     key_found = False
@@ -567,7 +646,7 @@ def update_env_file(file_path, key, new_value):
             file.writelines(updated_lines)
         return True
     except Exception as e:
-        print_error(f"{sys._getframe().f_code.co_name}(): {e}")
+        print_error(f"update_env_file(): {e}")
         return False
 
 
@@ -610,6 +689,8 @@ parser.add_argument('--install', action='store_true', help='Install required pac
 parser.add_argument("--format", "-fmt", choices=["table", "csv", "json"], 
                     default="table", help="Output format (default: table)")
 parser.add_argument("-do", "--delout", action="store_true", help="Delete output file")
+parser.add_argument("--high-security", action="store_true", help="Generate RSA-4096 instead of RSA-3072 keys (slower)")
+parser.add_argument("--continue-after-provisioning", action="store_true", help="After creating the service account, go on to the ADC and other examples")
 # Load arguments from CLI:
 args = parser.parse_args()
 
@@ -644,25 +725,24 @@ def print_module_filenames() -> None:
     """
     USAGE: print_filename()
     """
-    print_trace(f"At {sys._getframe().f_code.co_name}()")
+    print_trace("At print_module_filenames()")
 
     #import inspect
     current_frame = inspect.currentframe()
     filename = inspect.getfile(current_frame)
-    print(f"inspect.getfile(currentframe()): {os.path.basename(filename)}")
+    print(f"inspect.getfile(currentframe()): {Path(filename).name}")
 
-    filename_no_ext = os.path.splitext(os.path.basename(__file__))[0]
-    print(f"__file__ without extension:      {filename_no_ext}     created:  {ctimestamp(__file__)} " )
+    print(f"__file__ without extension:      {_SELF_STEM}     created:  {ctimestamp(__file__)} " )
 
     #import sys
     current_module = sys.modules[__name__]
-    print(f"Filename only:      {os.path.basename(__file__):>23}  modified: {mtimestamp(__file__)}")
+    print(f"Filename only:      {_SELF_NAME:>23}  modified: {mtimestamp(__file__)}")
 
     if hasattr(current_module, '__file__'):
-        print(f"os.path.basename():              {os.path.basename(current_module.__file__)} ")
+        print(f"os.path.basename():              {_SELF_NAME} ")
         print(f"current_module.__file__:    {current_module.__file__}")
 
-    print(f"os.path.abspath(__file__):  {os.path.abspath(__file__)} ")
+    print(f"Path(__file__).resolve():  {_SELF_PATH} ")
 
     return None
 
@@ -671,33 +751,37 @@ def is_macos() -> str:
     #import platform
     # Instead of: return platform.system() == "Darwin"
     patform_system = platform.system()
-    print_verbose(f"{sys._getframe().f_code.co_name}(): {patform_system} ")
+    print_verbose(f"is_macos(): {patform_system} ")
     if patform_system == "Darwin":
         return True
     else:
         return False
 
 
+# Cloud platform environment variables (a tuple, not rebuilt per call):
+_CLOUD_VARS = (
+    'HEROKU_APP_NAME',
+    'AWS_EXECUTION_ENV',
+    'GOOGLE_CLOUD_PROJECT',
+    'AZURE_FUNCTIONS_ENVIRONMENT',
+    'VERCEL',
+    'NETLIFY',
+)
+
 # Alternative approach using specific environment checks:
+@functools.lru_cache(maxsize=1)
 def is_local_development():
     """
     Alternative method focusing on common deployment patterns.
+    The answer cannot change during a run, so it is computed on the first call only.
+    Call is_local_development.cache_clear() to re-check (such as after changing env vars in tests).
     """
     # Check for containerized environments (usually not local)
     if os.path.exists('/.dockerenv') or os.getenv('KUBERNETES_SERVICE_HOST'):
         return False
     
     # Check for cloud platform environment variables
-    cloud_indicators = [
-        'HEROKU_APP_NAME',
-        'AWS_EXECUTION_ENV',
-        'GOOGLE_CLOUD_PROJECT',
-        'AZURE_FUNCTIONS_ENVIRONMENT',
-        'VERCEL',
-        'NETLIFY',
-    ]
-    
-    if any(os.getenv(var) for var in cloud_indicators):
+    if any(os.getenv(var) for var in _CLOUD_VARS):
         return False
     
     # If none of the above, likely local
@@ -735,6 +819,14 @@ def set_cli_parms(count):
 #### SECTION 06: Logging utility functions:
 
 
+# UTC is literal: %Z of time.gmtime() gives "GMT" on some platforms:
+_LOG_DATETIME_FMT = "%y%m%d%H%MUTC"
+
+@functools.lru_cache(maxsize=1)
+def _log_datetime_at(epoch_sec: int) -> str:
+    """Return epoch_sec formatted by _LOG_DATETIME_FMT in UTC, using time (not datetime) objects."""
+    return time.strftime(_LOG_DATETIME_FMT, time.gmtime(epoch_sec))
+
 def get_log_datetime() -> str:
     """
     Returns a formatted datetime string in UTC (GMT) timezone so all logs are aligned.
@@ -747,8 +839,8 @@ def get_log_datetime() -> str:
     # To get current time in (non-naive) UTC timezone
     # instead of: now_utc = datetime.now(timezone('UTC'))
     # Based on https://docs.python.org/3/library/datetime.html#datetime.datetime.utcnow
-    fts = datetime.fromtimestamp(time.time(), tz=timezone.utc)
-    time_str = fts.strftime("%y%m%d%H%M%Z")  # EX: "...-250419" UTC %H%M%Z https://strftime.org
+    # Formatted at most once per second, even when every log line asks for it:
+    time_str = _log_datetime_at(int(time.time()))  # EX: "...-250419" UTC %H%M https://strftime.org
 
     # See https://stackoverflow.com/questions/7588511/format-a-datetime-into-a-string-with-milliseconds
     # time_str=datetime.utcnow().strftime('%F %T.%f')
@@ -771,9 +863,9 @@ def export_optel():
     """ Create and export a trace to your console:
     https://www.perplexity.ai/search/python-code-to-use-opentelemet-bGjntbF4Sk6I6z3l5HBBSg#0
     """
-    #from opentelemetry import trace
-    #from opentelemetry.sdk.trace import TracerProvider
-    #from opentelemetry.sdk.trace.export import ConsoleSpanExporter, SimpleSpanProcessor
+    from opentelemetry import trace
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import ConsoleSpanExporter, SimpleSpanProcessor
 
     # Set up the tracer provider and exporter
     trace.set_tracer_provider(TracerProvider())
@@ -793,25 +885,27 @@ def export_optel():
 #### SECTION 07: Operating System properties
 
 
+_IS_DARWIN = sys.platform == "darwin"
+# ru_maxrss is in bytes on macOS but KiB on Linux; divisor to get MB:
+_MAXRSS_DENOM = 1024**2 if _IS_DARWIN else 1024
+
 def mem_usage(tag):
     """
     USAGE: print(f"Memory used: {myutils.mem_usage("myutils.py")}")
     """
-    mem = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
-    denom = 1024
-    if sys.platform == "darwin":
-        denom = denom**2
-    print(f'memory used is at {tag} : {round(mem/denom,2)} MB')
+    if not show_verbose:   # Skip the getrusage() syscall when nothing is shown.
+        return None
+    print(f'memory used is at {tag} : {round(get_peak_memory(),2)} MB')
 
 def beautify_json(file,outfile=None):
     """
-    USAGE: myutils.beautify_json("myutils.py"))
+    USAGE: myutils.beautify_json("sample.json")
+    Rewrites JSON with sorted keys and 2-space indents (orjson's only indent) to outfile or in place.
     """
-    js = json.loads(open(file).read())
+    js = _json_loads(Path(file).read_bytes())   # file closed right after reading
     if outfile is None:
         outfile=file
-    with open(outfile, 'w') as outfilep:
-        json.dump(js,outfilep,sort_keys=True,indent=4)
+    Path(outfile).write_bytes(_json_dumps(js, sort_keys=True))
 
 def get_fuid(fileName):
     """ Returns user id (such as "johndoe")
@@ -819,15 +913,32 @@ def get_fuid(fileName):
     """
     return(pwd.getpwuid(os.stat(fileName).st_uid).pw_name)
 
-def execsh(command):
+def execsh(command, shell=False):
     """
-    USAGE: myutils.execsh("echo")
-    FIXME: PIPE?
+    USAGE: myutils.execsh("echo hello")
+    Runs command directly (split by shlex like a shell would), without forking /bin/sh first.
+    Pass shell=True for commands that need shell syntax such as pipes, redirects, or $VARS.
+    Returns the command's stdout text.
     """
-    PIPE=subprocess.PIPE
-    result = subprocess.run(command, stdout=PIPE, stderr=PIPE, universal_newlines=True, shell=True)
+    args = command if shell or not isinstance(command, str) else shlex.split(command)
+    result = subprocess.run(args, capture_output=True, text=True, shell=shell, check=False)
     return result.stdout
 
+def execsh_many(commands) -> list:
+    """
+    USAGE: outputs = myutils.execsh_many(["sw_vers -productVersion", "uname -m"])
+    Runs several shell commands in one /bin/sh child instead of a fork and exec of sh for each.
+    Returns a list of each command's stdout text, in order.
+    Commands run in sequence in the same shell, so a cd or variable set by one is seen by the next.
+    """
+    # Marker line printed after each command, unlikely to appear in real output:
+    sentinel = f"__execsh_many_{secrets.token_hex(8)}__"
+    script = "".join(f"{cmd}\nprintf '\\n%s\\n' '{sentinel}'\n" for cmd in commands)
+    result = subprocess.run(["/bin/sh", "-c", script], stdin=subprocess.DEVNULL,
+                            capture_output=True, text=True, check=False)
+    outputs = result.stdout.split(f"\n{sentinel}\n")
+    return outputs[:len(commands)]
+
 def force_link(src,linkName):
     """
     USAGE: myutils.force_link(???)
@@ -838,7 +949,7 @@ def force_link(src,linkName):
         if os.path.islink(linkName):
             os.remove(linkName)
             os.symlink(src,linkName)
-        print_error(f"{sys._getframe().f_code.co_name}(): {e}")
+        print_error(f"force_link(): {e}")
 
 
 # See https://bomonike.github.io/python-samples/#run_env
@@ -862,41 +973,43 @@ def os_platform():
     return my_platform
 
 
+# Darwin release (first two parts) -> [marketing name, year, version]; read-only view built once.
+# NOTE: Each value is a list!
+# This has to be updated every year, so perhaps put this in an external library so updated
+# gets loaded during each run.
+# Apple has a way of forcing users to upgrade, so this is used as an
+# example of coding.
+# FIXME: https://github.com/nexB/scancode-plugins/blob/main/etc/scripts/homebrew.py
+# See https://support.apple.com/en-us/HT201260 and https://www.wikiwand.com/en/MacOS_version_history
+MACOS_VERSIONS = MappingProxyType({
+    '22.8': ['Next2025', 2025, '25'],
+    '22.7': ['Next2024', 2024, '24'],
+    '22.6': ['macOS Sonoma', 2023, '23'],
+    '22.5': ['macOS Ventura', 2022, '13'],
+    '12.1': ['macOS Monterey', 2021, '21'],
+    '11.1': ['macOS Big Sur', 2020, '20'],
+    '10.15': ['macOS Catalina', 2019, '19'],
+    '10.14': ['macOS Mojave', 2018, '18'],
+    '10.13': ['macOS High Sierra', 2017, '17'],
+    '10.12': ['macOS Sierra', 2016, '16'],
+    '10.11': ['OS X El Capitan', 2015, '15'],
+    '10.10': ['OS X Yosemite', 2014, '14'],
+    '10.9': ['OS X Mavericks', 2013, '10.9'],
+    '10.8': ['OS X Mountain Lion', 2012, '10.8'],
+    '10.7': ['OS X Lion', 2011, '10.7'],
+    '10.6': ['Mac OS X Snow Leopard', 2008, '10.6'],
+    '10.5': ['Mac OS X Leopard', 2007, '10.5'],
+    '10.4': ['Mac OS X Tiger', 2005, '10.4'],
+    '10.3': ['Mac OS X Panther', 2004, '10.3'],
+    '10.2': ['Mac OS X Jaguar', 2003, '10.2'],
+    '10.1': ['Mac OS X Puma', 2002, '10.1'],
+    '10.0': ['Mac OS X Cheetah', 2001, '10.0'],
+})
+
 def macos_version_name(release_in):
     """Returns the marketing name of macOS versions which are not available
     from the running macOS operating system.
     """
-    # NOTE: Return value is a list!
-    # This has to be updated every year, so perhaps put this in an external library so updated
-    # gets loaded during each run.
-    # Apple has a way of forcing users to upgrade, so this is used as an
-    # example of coding.
-    # FIXME: https://github.com/nexB/scancode-plugins/blob/main/etc/scripts/homebrew.py
-    # See https://support.apple.com/en-us/HT201260 and https://www.wikiwand.com/en/MacOS_version_history
-    MACOS_VERSIONS = {
-        '22.8': ['Next2025', 2025, '25'],
-        '22.7': ['Next2024', 2024, '24'],
-        '22.6': ['macOS Sonoma', 2023, '23'],
-        '22.5': ['macOS Ventura', 2022, '13'],
-        '12.1': ['macOS Monterey', 2021, '21'],
-        '11.1': ['macOS Big Sur', 2020, '20'],
-        '10.15': ['macOS Catalina', 2019, '19'],
-        '10.14': ['macOS Mojave', 2018, '18'],
-        '10.13': ['macOS High Sierra', 2017, '17'],
-        '10.12': ['macOS Sierra', 2016, '16'],
-        '10.11': ['OS X El Capitan', 2015, '15'],
-        '10.10': ['OS X Yosemite', 2014, '14'],
-        '10.9': ['OS X Mavericks', 2013, '10.9'],
-        '10.8': ['OS X Mountain Lion', 2012, '10.8'],
-        '10.7': ['OS X Lion', 2011, '10.7'],
-        '10.6': ['Mac OS X Snow Leopard', 2008, '10.6'],
-        '10.5': ['Mac OS X Leopard', 2007, '10.5'],
-        '10.4': ['Mac OS X Tiger', 2005, '10.4'],
-        '10.3': ['Mac OS X Panther', 2004, '10.3'],
-        '10.2': ['Mac OS X Jaguar', 2003, '10.2'],
-        '10.1': ['Mac OS X Puma', 2002, '10.1'],
-        '10.0': ['Mac OS X Cheetah', 2001, '10.0'],
-    }
     # WRONG: On macOS Monterey, platform.mac_ver()[0]) returns "10.16", which is Big Sur and thus wrong.
     # See https://eclecticlight.co/2020/08/13/macos-version-numbering-isnt-so-simple/
     # and https://stackoverflow.com/questions/65290242/pythons-platform-mac-ver-reports-incorrect-macos-version/65402241
@@ -909,10 +1022,13 @@ def macos_version_name(release_in):
     # result = p.communicate()[0]
     macos_platform_release = platform.release()
     # Alternately:
-    release = '.'.join(release_in.split(".")[:2])  # ['10', '15', '7']
-    macos_info = MACOS_VERSIONS[release]  # lookup for ['Monterey', 2021]
-    print_trace("macos_info="+str(macos_info))
-    print_trace("macos_platform_release="+macos_platform_release)
+    # First two parts of like "10.15.7", without building a list:
+    major, _, rest = release_in.partition(".")
+    minor = rest.partition(".")[0]
+    release = f"{major}.{minor}"
+    macos_info = MACOS_VERSIONS.get(release)  # lookup for ['Monterey', 2021], None if unknown
+    print_trace("macos_info=%s", macos_info)
+    print_trace("macos_platform_release=%s", macos_platform_release)
     return macos_platform_release
 
 
@@ -924,71 +1040,113 @@ def is_running_locally() -> bool:
     Returns True if the program is running in a local development environment.
     Returns False if in production/remote environment (within a server/VM).
     """    
-    # Method 1: Check for common local development indicators:
-    local_indicators = [
+    # Method 1: Check for common local development indicators.
+    # Each check is called only until one is True, cheapest first,
+    # so the socket and filesystem probes are skipped when an env var answers:
+    local_indicators = (
         # Development environment variables
-        os.getenv('DEVELOPMENT') == 'true',
-        os.getenv('DEBUG') == 'true',
-        os.getenv('ENV') == 'development',
-        os.getenv('ENVIRONMENT') == 'local',
+        lambda: os.getenv('DEVELOPMENT') == 'true',
+        lambda: os.getenv('DEBUG') == 'true',
+        lambda: os.getenv('ENV') == 'development',
+        lambda: os.getenv('ENVIRONMENT') == 'local',
         
-        # Common local hostnames/IPs:
-        socket.gethostname().lower() in ['localhost', '127.0.0.1'],
+        # Interactive terminal (likely local development)
+        lambda: sys.stdin.isatty() and sys.stdout.isatty(),
         
-        # Check if running on local IP ranges
-        _is_local_ip(),
+        # Common local hostnames/IPs:
+        lambda: socket.gethostname().lower() in ('localhost', '127.0.0.1'),
         
         # Development tools/paths present
-        Path('.git').exists(),  # Git repository
-        Path('requirements.txt').exists() or Path('pyproject.toml').exists(),
+        lambda: Path('.git').exists(),  # Git repository
+        lambda: Path('requirements.txt').exists() or Path('pyproject.toml').exists(),
         
-        # Interactive terminal (likely local development)
-        sys.stdin.isatty() and sys.stdout.isatty(),
-    ]
+        # Check if running on local IP ranges (cached UDP socket lookup)
+        _is_local_ip,
+    )
     
-    return any(local_indicators)
+    return any(check() for check in local_indicators)
 
 def _is_local_ip():
     """Check if running on a local IP address."""
     try:
-        # Get local IP by connecting to external address
-        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
-            s.connect(("8.8.8.8", 80))
-            local_ip = s.getsockname()[0]
-            
-        # Check if IP is in private ranges
-        ip_parts = local_ip.split('.')
-        if len(ip_parts) == 4:
-            first_octet = int(ip_parts[0])
-            second_octet = int(ip_parts[1])
-            
-            # Private IP ranges: 10.x.x.x, 172.16-31.x.x, 192.168.x.x
-            return (first_octet == 10 or 
-                   (first_octet == 172 and 16 <= second_octet <= 31) or
-                   (first_octet == 192 and second_octet == 168) or
-                   local_ip == '127.0.0.1')
+        # Local IP from the cached routing-table lookup:
+        addr = ip_address(_get_local_ip())
+        # Private ranges (10/8, 172.16/12, 192.168/16, link-local, ...) or loopback:
+        return addr.is_private or addr.is_loopback
+    except ValueError:   # "Unknown" when the lookup failed
+        return False
     except Exception as e:
-        print_error(f"{sys._getframe().f_code.co_name}(): {e}")
+        print_error(f"_is_local_ip(): {e}")
         return False
 
-def get_environment_info():
-    """Returns a dictionary of detailed information about the current environment.
-    """
-    return {
-        'hostname': socket.gethostname(),
-        'platform': sys.platform,
-        'python_version': sys.version,
-        'working_directory': os.getcwd(),
-        'environment_vars': {
-            'PATH': os.getenv('PATH', ''),
-            'HOME': os.getenv('HOME', ''),
-            'USER': os.getenv('USER', ''),
-            'SHELL': os.getenv('SHELL', ''),
-        },
-        'is_interactive': sys.stdin.isatty(),
-        'has_git': Path('.git').exists(),
-        'local_ip': _get_local_ip(),
-    }
+class EnvironmentInfo(Mapping):
+    """Detailed information about the current environment, as a read-only mapping.
+    Each field is looked up only when first read (then cached), so asking for
+    hostname does not also open the UDP socket behind local_ip.
+    Fields read as attributes (info.hostname) or as keys (info['hostname']), and
+    `in`, get(), items(), len() and iteration work as on the dict this used to be.
+    json.dumps() needs a real dict: json.dumps(dict(info)).
+    """
+    _FIELDS = ('hostname', 'platform', 'python_version', 'working_directory',
+               'environment_vars', 'is_interactive', 'has_git', 'local_ip')
+
+    platform = sys.platform
+    python_version = sys.version
+
+    @functools.cached_property
+    def hostname(self):
+        return socket.gethostname()
+
+    @functools.cached_property
+    def working_directory(self):
+        return os.getcwd()
+
+    @functools.cached_property
+    def environment_vars(self):
+        return {var: os.getenv(var, '') for var in ('PATH', 'HOME', 'USER', 'SHELL')}
+
+    @functools.cached_property
+    def is_interactive(self):
+        return sys.stdin.isatty()
+
+    @functools.cached_property
+    def has_git(self):
+        return Path('.git').exists()
+
+    @functools.cached_property
+    def local_ip(self):
+        return _get_local_ip()
+
+    def __getitem__(self, key):
+        if key not in self._FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __contains__(self, key):   # Without looking the field up.
+        return key in self._FIELDS
+
+    def __iter__(self):
+        return iter(self._FIELDS)
+
+    def __len__(self):
+        return len(self._FIELDS)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Every field, looking up any not read yet."""
+        return dict(self)
+
+    def __repr__(self):
+        return f"EnvironmentInfo({self.as_dict()})"
+
+def get_environment_info() -> EnvironmentInfo:
+    """Returns detailed information about the current environment,
+    as an EnvironmentInfo whose fields are looked up on first access.
+    """
+    return EnvironmentInfo()
+
+# Last _get_local_ip() result, reused for _LOCAL_IP_TTL seconds:
+_LOCAL_IP_CACHE = {"ip": None, "ts": 0.0}
+_LOCAL_IP_TTL = 60.0
 
 def _get_local_ip():
     """Returns the local IP address such as 192.168.1.23. 
@@ -996,104 +1154,186 @@ def _get_local_ip():
     the operating system's routing table determines which 
     local network interface (and its associated IP address) 
     is used to reach the internet rather than localhost (127.0.0.1).
+    The result is cached for _LOCAL_IP_TTL seconds so repeated calls skip the socket.
     """
+    now = time.monotonic()
+    if _LOCAL_IP_CACHE["ip"] is not None and now - _LOCAL_IP_CACHE["ts"] < _LOCAL_IP_TTL:
+        return _LOCAL_IP_CACHE["ip"]
     try:
         with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
             s.connect(("8.8.8.8", 80))
-            return s.getsockname()[0]
+            local_ip = s.getsockname()[0]
     except Exception as e:
-        print(f"{sys._getframe().f_code.co_name}(): {e}")
-        return "Unknown"
+        print(f"_get_local_ip(): {e}")
+        local_ip = "Unknown"
+    _LOCAL_IP_CACHE["ip"], _LOCAL_IP_CACHE["ts"] = local_ip, now
+    return local_ip
+
+def invalidate_local_ip_cache() -> None:
+    """Forget the cached local IP so the next _get_local_ip() looks it up again."""
+    _LOCAL_IP_CACHE["ip"] = None
+
+
+async def probe_all(urls, timeout: float = 5.0) -> Dict[str, Any]:
+    """
+    USAGE: statuses = asyncio.run(myutils.probe_all(["https://www.google.com", "https://github.com"]))
+    Send a HEAD request to each URL at the same time, so the total wait is about
+    the slowest probe rather than the sum of all of them.
+    Returns: dict of url -> HTTP status code, or None if the URL could not be reached.
+    """
+    import requests
+    # One Session so probes to the same host reuse its connection pool:
+    with requests.Session() as session:
+        def _probe(url):
+            try:
+                return session.head(url, timeout=timeout, allow_redirects=True).status_code
+            except requests.RequestException as e:
+                print_trace("probe_all(): %s: %s", url, e)
+                return None
+        statuses = await asyncio.gather(*(asyncio.to_thread(_probe, url) for url in urls))
+    return dict(zip(urls, statuses))
 
 
 #### SECTION 09: OS Process memory handling:
 
 
+GB_BYTES = 1 << 30  # = 1024 * 1024 * 1024 = Gigabyte
+
 def get_process_memory() -> float:
     """
     Returns MiB of memory used by the current process.
     """
     # import os, psutil  #  psutil-5.9.5
-    process = psutil.Process(os.getpid())
+    process = _PROC
     # Divide by (1024 * 1024) to convert bytes to MB:
     mem=process.memory_info().rss / 1048576
-    print_trace(f"{str(process)} MiB from get_process_memory()")
+    # %-args are formatted only when tracing is on; pid is a cached int, unlike str(process):
+    print_trace("pid %d: %.2f MiB from get_process_memory()", process.pid, mem)
     return float(mem)
 
-def get_all_objects_by_type():
-    """Get memory usage by object type."""
-    type_sizes = defaultdict(int)
-    type_counts = defaultdict(int)
-    
+def get_peak_memory() -> float:
+    """
+    Returns MiB of the current process's peak (high-water mark) resident memory.
+    One getrusage() syscall; no psutil object or /proc read.
+    This is the peak, not current RSS, so use get_process_memory() for before/after deltas.
+    """
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / _MAXRSS_DENOM
+
+# Weak proxies forward __sizeof__ to their referent (ReferenceError once it is gone),
+# so they are counted but not sized:
+_SKIP_SIZE_TYPES = frozenset({weakref.ProxyType, weakref.CallableProxyType})
+
+def get_all_objects_by_type(sample_rate: float = 0.01):
+    """Get memory usage by object type.
+    Returns (type_sizes, type_counts) keyed by type object; callers use .__name__ to print.
+    Sizes only about sample_rate of the objects (Bernoulli sampling) and scales
+    the sums by 1/sample_rate, so results are estimates; rare types may be missed.
+    Pass sample_rate=1.0 for an exact (slower) sweep of every object.
+    """
     # Force garbage collection to get more accurate results:
     # import gc
     gc.collect()
     
-    # Get all objects tracked by the garbage collector
-    for obj in gc.get_objects():
+    # Get all objects tracked by the garbage collector (one snapshot):
+    objs = gc.get_objects()
+    exact = sample_rate >= 1.0
+    if not exact:
+        _random = random.random
+        objs = [obj for obj in objs if _random() < sample_rate]
+    scale = 1.0 if exact else 1.0 / sample_rate
+    
+    # Counter consumes map(type, ...) in C; no per-object name lookup:
+    type_counts = Counter(map(type, objs))
+    
+    # Locals avoid global/attribute lookups inside the loop:
+    _getsizeof = sys.getsizeof
+    _type = type
+    _skip = _SKIP_SIZE_TYPES
+    type_sizes = defaultdict(int)
+    for obj in objs:
+        obj_type = _type(obj)
+        if obj_type in _skip:
+            continue
         try:
-            obj_type = type(obj).__name__
-            # import sys
-            obj_size = sys.getsizeof(obj)
-            type_sizes[obj_type] += obj_size
-            type_counts[obj_type] += 1
-        except Exception as e:
-            print_verbose(f"{sys._getframe().f_code.co_name}(): {e} ")
-            pass  # Skip objects that can't be processed
+            type_sizes[obj_type] += _getsizeof(obj)
+        except TypeError as e:   # a __sizeof__ that does not return an int
+            print_verbose("get_all_objects_by_type(): %s", e)
     
+    if not exact:   # Scale the per-type sums (few keys) rather than each object:
+        for obj_type in type_sizes:
+            type_sizes[obj_type] *= scale
+        for obj_type in type_counts:
+            type_counts[obj_type] *= scale
     return type_sizes, type_counts
 
 def trace_memory_usage(func):
     """Decorator @trace_memory_usage to trace memory usage before and after 
     calling a function that uses a dubiously large amount of memory.
     """
+    import tracemalloc   # Only paid for by programs that decorate a function.
+    func_name = func.__name__   # looked up once, at decoration time
+    # Leave tracemalloc's own bookkeeping out of the snapshot diff:
+    snapshot_filters = (tracemalloc.Filter(False, tracemalloc.__file__),)
+
     def wrapper(*args, **kwargs):
-        tracemalloc.start()
-        start_memory = get_process_memory()
-        print_verbose(f"{'Memory before:':<43} {start_memory:.2f} MB")
+        # When an outer traced call already started tracemalloc, reuse it
+        # and leave stopping (which discards all traces) to that outer call:
+        started_here = not tracemalloc.is_tracing()
+        if started_here:
+            tracemalloc.start()
+        try:
+            start_memory = get_process_memory()
+            print_verbose("%-43s %.2f MB", f'Memory before {func_name}():', start_memory)
+            snap_before = tracemalloc.take_snapshot().filter_traces(snapshot_filters)
         
-        result = func(*args, **kwargs)
+            result = func(*args, **kwargs)
         
-        current, peak = tracemalloc.get_traced_memory()
-        print_verbose(f"    {'tracemalloc current:':<43} {current / (1024 * 1024):.2f} MB")
-        print_verbose(f"    {'tracemalloc peak:':<43} {peak / (1024 * 1024):.2f} MB")
-        end_memory = get_process_memory()
-        print_verbose(f"    {'Memory after:':<43} {end_memory:.2f} MB")
-        print_verbose(f"    {'Memory used:':<43} {end_memory - start_memory:.2f} MB")
+            snap_after = tracemalloc.take_snapshot().filter_traces(snapshot_filters)
+            # Allocations made during the call; RSS below is only context
+            # because it also moves with freed-but-kept pages and shared libraries:
+            allocated = sum(stat.size_diff for stat in snap_after.compare_to(snap_before, 'filename'))
+            current, peak = tracemalloc.get_traced_memory()
+            print_verbose("    %-43s %.2f MB", 'tracemalloc allocated by call:', allocated / (1024 * 1024))
+            print_verbose("    %-43s %.2f MB", 'tracemalloc current:', current / (1024 * 1024))
+            print_verbose("    %-43s %.2f MB", 'tracemalloc peak:', peak / (1024 * 1024))
+            end_memory = get_process_memory()
+            print_verbose("    %-43s %.2f MB", 'Memory after (RSS):', end_memory)
+            print_verbose("    %-43s %.2f MB", 'RSS change:', end_memory - start_memory)
         
-        # import tracemalloc
-        tracemalloc.stop()
-        return result
+            return result
+        finally:
+            if started_here:
+                tracemalloc.stop()
     
     return wrapper
 
 def show_memory_profile():
     """Print detailed memory usage information.
     """
-    GB_BYTES = 1073741824  # = 1024 * 1024 * 1024 = Terrabyte
-
-    print_verbose("show_memory_profile():")
+    if not show_verbose:   # Everything below is only shown by print_verbose():
+        return None
 
     system_memory = psutil.virtual_memory()
-    print_verbose(f"psutil.virtual_memory(): {system_memory.percent}% "
-        f"(Available: {system_memory.available / GB_BYTES:.2f} GB"
-        f", System: {system_memory.total / GB_BYTES:.2f} GB)")
-
-    print_verbose(f"{'    Total process memory: ':<43} {get_process_memory():.2f} MB")
-    process = psutil.Process(os.getpid())
-    memory_info = process.memory_info()
-    print_verbose(f"{'    RSS (Resident Set Size):':<43} {memory_info.rss / (1024 * 1024):.2f} MB")
-    print_verbose(f"{'    VMS (Virtual Memory Size):':<43} {memory_info.vms / (1024 * 1024):.2f} MB")
-    
+    process_memory = get_process_memory()
+    memory_info = _PROC.memory_info()
     # Get memory usage by type
     type_sizes, type_counts = get_all_objects_by_type()
+
+    # Lines are collected, then written at once, each with print_verbose()'s emoji and date:
+    lines = ["show_memory_profile():"]
+    lines.append("psutil.virtual_memory(): %s%% (Available: %.2f GB, System: %.2f GB)" % (
+        system_memory.percent, system_memory.available / GB_BYTES, system_memory.total / GB_BYTES))
+    lines.append("%-43s %.2f MB" % ('    Total process memory: ', process_memory))
+    lines.append("%-43s %.2f MB" % ('    RSS (Resident Set Size):', memory_info.rss / (1024 * 1024)))
+    lines.append("%-43s %.2f MB" % ('    VMS (Virtual Memory Size):', memory_info.vms / (1024 * 1024)))
     
-    # Show top 10 memory consumers by type
-    print_verbose("Top 10 memory consumers by type:")
-    top_types = sorted(type_sizes.items(), key=lambda x: x[1], reverse=True)[:10]
+    # Show top 10 memory consumers by type (estimated from a sample)
+    lines.append("Top 10 memory consumers by type:")
+    top_types = nlargest(10, type_sizes.items(), key=itemgetter(1))
     for obj_type, size in top_types:
         count = type_counts[obj_type]
-        print_verbose(f"    {obj_type:<43} {size / (1024 * 1024):.2f} MB ({count} objects)")
+        lines.append("    %-43s %.2f MB (%d objects)" % (obj_type.__name__, size / (1024 * 1024), count))
+    print_verbose_lines(lines)
     
     # Show other system information
     # print(f"\nPython version: {sys.version}")
@@ -1107,12 +1347,12 @@ def get_disk_free() -> (float, str):
     Returns float GB of disk space free and text of percentage free.
     References global GB_BYTES.
     """
-    GB_BYTES = 1073741824  # = 1024 * 1024 * 1024 = Terrabyte
-    # import shutil
-    # Replace '/' with your target path (e.g., 'C:\\' on Windows)
-    usage = shutil.disk_usage('/')
-    pct_free = ( float(usage.free) / float(usage.total) ) * 100
-    disk_gb_free = float(usage.free) / GB_BYTES
+    # os.statvfs() directly, as shutil.disk_usage() does on POSIX, without its namedtuple:
+    # Replace '/' with your target path
+    st = os.statvfs('/')
+    free = st.f_bavail * st.f_frsize
+    pct_free = free / (st.f_blocks * st.f_frsize) * 100
+    disk_gb_free = free / GB_BYTES
     disk_pct_free = f"{pct_free:.2f}%"
     # print_verbose(f"get_disk_free(): {disk_gb_free:.2f} ({pct_free:.2f}%) disk free")
     return disk_gb_free, disk_pct_free
@@ -1127,28 +1367,17 @@ def stats_to_file(filepath) -> bool:
     which is the cleanest and most pythonic way.
     """
     if not filepath:  # if filepath is empty
-       filepath = f"{os.getcwd()}/stats_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.txt"
-    elif os.path.isfile(filepath):  # if file exists, so append:
-        try:
-            with open('append_output.txt', 'a') as f:
-                original_stdout = sys.stdout
-                sys.stdout = f
-                
-                macos_sys_info()  # appended to existing file.
-                
-                sys.stdout = original_stdout
-        except Exception as e:
-            print(f"{sys._getframe().f_code.co_name}(\"{filepath}\") append: {e}")
-    else:  # not exist:
-        try:
-            # from contextlib import redirect_stdout
-            with open(filepath, 'w') as f:
-                with redirect_stdout(f):
-                    macos_sys_info()
-            # print("Back to console")
-            return True
-        except Exception as e:
-            print(f"{sys._getframe().f_code.co_name}(\"{filepath}\") add: {e}")
+        filepath = f"{os.getcwd()}/stats_{datetime.now().strftime('%Y-%m-%d_%H-%M-%S')}.txt"
+    # Append to an existing file, otherwise create it:
+    mode = 'a' if os.path.isfile(filepath) else 'w'
+    try:
+        # from contextlib import redirect_stdout
+        with open(filepath, mode) as f, redirect_stdout(f):
+            macos_sys_info()
+        # print("Back to console")
+        return True
+    except Exception as e:
+        print(f"stats_to_file(\"{filepath}\") mode {mode}: {e}")
     return False
 
 
@@ -1203,115 +1432,86 @@ def get_file_size_on_disk(file_path: str) -> int:
 #### SECTION 09: Display System information:
 
 
+# One print_trace() line per field, %-rendered from a dict and written at once by print_trace_lines():
+_SYS_INFO_LINES = (
+    "my_platform_node = %(my_platform_node)s (machine name)",
+    "user_home_dir_path = %(user_home_dir_path)s",
+    "platform_system = %(platform_system)s",
+    "my_os_version = %(my_os_version)s",
+    "my_os_process = %(my_os_process)s",
+    "my_os_uname = %(my_os_uname)s",
+    "pwuid_shell = %(pwuid_shell)s",
+    "pwuid_gid = %(pwuid_gid)s (process group ID number)",
+    "pwuid_uid = %(pwuid_uid)s (process user ID number)",
+    "pwuid_name = %(pwuid_name)s",
+    "pwuid_dir = %(pwuid_dir)s",
+    "this_pgm_name = %(this_pgm_name)s",
+    "this_pgm_os_path = %(this_pgm_os_path)s",
+    "site_packages_path = %(site_packages_path)s",
+    "this_pgm_last_modified_epoch = %(this_pgm_last_modified_epoch)s",
+    "python_ver = %(python_ver)s",
+    "python_version = %(python_version)s",
+    "python_version_info = %(python_version_info)s",
+)
+
 def macos_sys_info():
 
     if not show_sys_info:   # defined among CLI arguments
         return None
 
-    print_heading("macos_sys_info():")
-
-        # or socket.gethostname()
-    my_platform_node = platform.node()
-    print_trace("my_platform_node = "+my_platform_node + " (machine name)")
-
-    print_trace("user_home_dir_path = "+str(Path.home())  )
-    # the . in .secrets tells Linux that it should be a hidden file.
-
-    # import platform # https://docs.python.org/3/library/platform.html
-    platform_system = platform.system()
-       # 'Linux', 'Darwin', 'Java', 'Win32'
-    print_trace("platform_system = "+str(platform_system))
-
-    # my_os_platform=localize_blob("version")
-    print_trace("my_os_version = "+str(platform.release()))
-    #           " = "+str(macos_version_name(my_os_version)))
-
-    my_os_process = str(os.getpid())
-    print_trace("my_os_process = "+my_os_process)
+    if sys.version_info.major == 3 and sys.version_info.minor <= 6:
+            # major, minor, micro, release level, and serial: for sys.version_info.major, etc.
+            # Version info sys.version_info(major=3, minor=7, micro=6,
+            # releaselevel='final', serial=0)
+        print_fail("Python 3.6 or higher is required for this program. Please upgrade.")
+        sys.exit(1)
 
-    my_os_uname = str(os.uname())
-    print_trace("my_os_uname = "+my_os_uname)
-        # MacOS version=%s 10.14.6 # posix.uname_result(sysname='Darwin',
-        # nodename='NYC-192850-C02Z70CMLVDT', release='18.7.0', version='Darwin
-        # Kernel Version 18.7.0: Thu Jan 23 06:52:12 PST 2020;
-        # root:xnu-4903.278.25~1/RELEASE_X86_64', machine='x86_64')
+    print_heading("macos_sys_info():")
+    if not show_trace:   # Everything below is gathered only to be shown by print_trace():
+        return None
 
     # import pwd   #  https://zetcode.com/python/os-getuid/
-    pwuid_shell = pwd.getpwuid(os.getuid()).pw_shell     # like "/bin/zsh" on MacOS
-        # preferred over os.getuid())[0]
-
-    # machine_uid_pw_name = psutil.Process().username()
-    print_trace("pwuid_shell = "+pwuid_shell)
-
-    # Obtain machine login name:
-    # This handles situation when user is in su mode.
+    # One passwd lookup for the current user; all pwuid_* fields come from this entry.
+    # Obtain machine login name: This handles situation when user is in su mode.
     # See https://docs.python.org/3/library/pwd.html
-    pwuid_gid = pwd.getpwuid(os.getuid()).pw_gid         # Group number datatype
-    print_trace("pwuid_gid = "+str(pwuid_gid)+" (process group ID number)")
+    pw = pwd.getpwuid(os.getuid())
 
-    pwuid_uid = pwd.getpwuid(os.getuid()).pw_uid
-    print_trace("pwuid_uid = "+str(pwuid_uid)+" (process user ID number)")
-
-    pwuid_name = pwd.getpwuid(os.getuid()).pw_name
-    print_trace("pwuid_name = "+pwuid_name)
-
-    pwuid_dir = pwd.getpwuid(os.getuid()).pw_dir         # like "/Users/johndoe"
-    print_trace("pwuid_dir = "+pwuid_dir)
-
-    # Several ways to obtain:
+    # Several ways to obtain this_pgm_name (used by display_run_stats() at bottom):
     # See https://stackoverflow.com/questions/4152963/get-name-of-current-script-in-python
-    # this_pgm_name = sys.argv[0]                     # = ./python-samples.py
-    # this_pgm_name = os.path.basename(sys.argv[0])   # = python-samples.py
-    # this_pgm_name = os.path.basename(__file__)      # = python-samples.py
-    # this_pgm_path = os.path.realpath(sys.argv[0])   # = python-samples.py
-    # Used by display_run_stats() at bottom:
-    this_pgm_name = os.path.basename(os.path.normpath(sys.argv[0]))
-    print_trace("this_pgm_name = "+this_pgm_name)
-
-    #this_pgm_last_commit = __last_commit__
-    #    # Adapted from https://www.python-course.eu/python3_formatted_output.php
-    #print_trace("this_pgm_last_commit = "+this_pgm_last_commit)
-
-    this_pgm_os_path = os.path.realpath(sys.argv[0])
-    print_trace("this_pgm_os_path = "+this_pgm_os_path)
-    # Example: this_pgm_os_path=/Users/wilsonmar/github-wilsonmar/python-samples/python-samples.py
-
-    # import site
-    site_packages_path = site.getsitepackages()[0]
-    print_trace("site_packages_path = "+site_packages_path)
-
-    this_pgm_last_modified_epoch = os.path.getmtime(this_pgm_os_path)
-    print_trace("this_pgm_last_modified_epoch = "+str(this_pgm_last_modified_epoch))
-
-    #this_pgm_last_modified_datetime = datetime.fromtimestamp(
-    #    this_pgm_last_modified_epoch)
-    #print_trace("this_pgm_last_modified_datetime=" +
-    #            str(this_pgm_last_modified_datetime)+" (local time)")
-        # Default like: 2021-11-20 07:59:44.412845  (with space between date & time)
-
-    # Obtain to know whether to use new interpreter features:
-    python_ver = platform.python_version()
-        # 3.8.12, 3.9.16, etc.
-    print_trace("python_ver = "+python_ver)
-
-    # python_info():
-    python_version = no_newlines(sys.version)
-        # 3.9.16 (main, Dec  7 2022, 10:16:11) [Clang 14.0.0 (clang-1400.0.29.202)]
-        # 3.8.3 (default, Jul 2 2020, 17:30:36) [MSC v.1916 64 bit (AMD64)]
-    print_trace("python_version = "+python_version)
-
-    print_trace("python_version_info = "+str(sys.version_info))
+    # sys.argv[0]                    # = ./python-samples.py
+    # os.path.basename(sys.argv[0])  # = python-samples.py
+    # os.path.basename(__file__)     # = python-samples.py
+    info = {
+        "my_platform_node": platform.node(),    # or socket.gethostname()
+        "user_home_dir_path": Path.home(),
+            # the . in .secrets tells Linux that it should be a hidden file.
+        "platform_system": platform.system(),   # 'Linux', 'Darwin', 'Java', 'Win32'
+        "my_os_version": platform.release(),
+        "my_os_process": os.getpid(),
+        "my_os_uname": os.uname(),
+            # posix.uname_result(sysname='Darwin', nodename='NYC-192850-C02Z70CMLVDT',
+            # release='18.7.0', version='Darwin Kernel Version 18.7.0: ...', machine='x86_64')
+        "pwuid_shell": pw.pw_shell,   # like "/bin/zsh" on MacOS
+        "pwuid_gid": pw.pw_gid,
+        "pwuid_uid": pw.pw_uid,
+        "pwuid_name": pw.pw_name,
+        "pwuid_dir": pw.pw_dir,       # like "/Users/johndoe"
+        "this_pgm_name": PROGRAM_NAME,
+        "this_pgm_os_path": _ARGV0_PATH,
+            # Example: /Users/wilsonmar/github-wilsonmar/python-samples/python-samples.py
+        "site_packages_path": site.getsitepackages()[0],
+        "this_pgm_last_modified_epoch": os.path.getmtime(_ARGV0_PATH),
+        # Obtain to know whether to use new interpreter features:
+        "python_ver": platform.python_version(),   # 3.8.12, 3.9.16, etc.
+        "python_version": no_newlines(sys.version),
+            # 3.9.16 (main, Dec  7 2022, 10:16:11) [Clang 14.0.0 (clang-1400.0.29.202)]
+        "python_version_info": sys.version_info,
+    }
+    print_trace_lines(line % info for line in _SYS_INFO_LINES)
         # Same as on command line: python -c "print_trace(__import__('sys').version)"
         # 2.7.16 (default, Mar 25 2021, 03:11:28)
         # [GCC 4.2.1 Compatible Apple LLVM 11.0.3 (clang-1103.0.29.20) (-macos10.15-objc-
 
-    if sys.version_info.major == 3 and sys.version_info.minor <= 6:
-            # major, minor, micro, release level, and serial: for sys.version_info.major, etc.
-            # Version info sys.version_info(major=3, minor=7, micro=6,
-            # releaselevel='final', serial=0)
-        print_fail("Python 3.6 or higher is required for this program. Please upgrade.")
-        sys.exit(1)
-
     # TODO: Make this function for call before & after run:
     #    disk_list = get_disk_free()
     #    disk_space_free = disk_list[1]:,.1f / disk_list[0]:,.1f
@@ -1328,10 +1528,11 @@ def show_summary() -> bool:
         return None
 
     print_separator()
-    print_heading(f"{sys._getframe().f_code.co_name}():")
+    print_heading("show_summary():")
 
     pgm_stop_mem_diff = get_process_memory() - float(pgm_strt_mem_used)
     print_info(f"{pgm_stop_mem_diff:.2f} MB memory consumed during run {RUNID}.")
+    print_info("%.2f MB peak memory during run %s.", get_peak_memory(), RUNID)
 
     pgm_stop_disk_free, pct_disk_free_now = get_disk_free()
     pgm_stop_disk_diff = pgm_strt_disk_free - pgm_stop_disk_free
@@ -1342,19 +1543,16 @@ def show_summary() -> bool:
 
     # For wall time of std imports:
     std_elapsed_wall_time = std_stop_timestamp -  std_strt_timestamp
-    print_verbose("for import of Python standard libraries: "+ \
-        f"{std_elapsed_wall_time:.4f}")
+    print_verbose("for import of Python standard libraries: %.4f", std_elapsed_wall_time)
 
     # For wall time of xpt imports:
     xpt_elapsed_wall_time = xpt_stop_timestamp -  xpt_strt_timestamp
-    print_verbose("for import of Python extra    libraries: "+ \
-        f"{xpt_elapsed_wall_time:.4f}")
+    print_verbose("for import of Python extra    libraries: %.4f", xpt_elapsed_wall_time)
 
     pgm_stop_timestamp =  time.monotonic()
     pgm_elapsed_wall_time = pgm_stop_timestamp -  pgm_strt_timestamp
     # pgm_stop_perftimestamp = time.perf_counter()
-    print_verbose("for whole program run:                   "+ \
-        f"{pgm_elapsed_wall_time:.4f}")
+    print_verbose("for whole program run:                   %.4f", pgm_elapsed_wall_time)
 
     # TODO: Write wall times to log for longer-term analytics
     return True
@@ -1375,18 +1573,29 @@ def list_pgm_functions(filename):
     """
     USAGE: print(myutils.list_pgm_functions("myutils.py"))
     """
-    #import importlib.util
-    spec = importlib.util.spec_from_file_location("module", filename)
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
-    
-    # Get all functions:
-    # import inspect
-    functions = inspect.getmembers(module, inspect.isfunction)
+    if Path(filename).resolve() == _SELF_PATH:
+        # This module is already loaded: read its namespace instead of parsing it again.
+        # unwrap() sees through decorators such as functools.lru_cache:
+        functions = []
+        for name, obj in vars(sys.modules[__name__]).items():
+            func = inspect.unwrap(obj)
+            # Defined here under this name (not imported from another module):
+            if inspect.isfunction(func) and func.__module__ == __name__ and func.__qualname__ == name:
+                functions.append(name)
+        functions.sort()
+    else:
+        # Read the function names from the source's AST rather than executing
+        # the module (which would rerun its import-time code, args parsing included):
+        with open(filename, 'rb') as file:
+            tree = ast.parse(file.read(), filename=filename)
+        
+        # Get all top-level functions:
+        functions = sorted(node.name for node in tree.body
+                           if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)))
     
     # Print function names:
     print(f"myutils.list_pgm_functions(\"{sys.argv[0]}\") alphabetically: ")
-    for name, func in functions:
+    for name in functions:
         print("    "+name)
 
 
@@ -1409,34 +1618,36 @@ def _extract_dunder_variables(filename: str) -> Dict[str, Any]:
     #import ast
     #import sys
     #from typing import Dict, Any
-    with open(filename, 'r', encoding='utf-8') as file:
-        source = file.read()
-    
-    # Parse the source code into an AST:
-    tree = ast.parse(source)
+    # Parse the source code into an AST straight from a read-only mapping of the file,
+    # so no decoded str copy is made (the parser honors any coding cookie):
+    with open(filename, 'rb') as file:
+        if os.fstat(file.fileno()).st_size == 0:   # mmap cannot map an empty file.
+            return {}
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as source:
+            tree = ast.parse(source, filename=filename)
     
     dunder_vars = {}  # Dictionary to store dunder variables
     # Find all assignments at the module level
     for node in tree.body:
         # Look for assignment statements
-        if isinstance(node, ast.Assign):
-            for target in node.targets:
-                # Check if the target is a name (variable)
-                if isinstance(target, ast.Name):
-                    var_name = target.id
-                    # Check if it's a dunder (starts and ends with double underscores)
-                    if var_name.startswith('__') and var_name.endswith('__'):
-                        # Try to evaluate the value
-                        try:
-                            value = ast.literal_eval(node.value)
-                            dunder_vars[var_name] = value
-                        except (ValueError, SyntaxError):
-                            # If we can't evaluate it, store it as a string representation
-                            dunder_vars[var_name] = f"<non-literal value: {ast.dump(node.value)}>"
+        if not isinstance(node, ast.Assign):
+            continue
+        for target in node.targets:
+            # Check if the target is a dunder name (starts and ends with double underscores)
+            if (isinstance(target, ast.Name)
+                    and target.id.startswith('__') and target.id.endswith('__')):
+                var_name = target.id
+                # Try to evaluate the value
+                try:
+                    value = ast.literal_eval(node.value)
+                    dunder_vars[var_name] = value
+                except (ValueError, SyntaxError):
+                    # If we can't evaluate it, store it as a string representation
+                    dunder_vars[var_name] = f"<non-literal value: {ast.dump(node.value)}>"
     return dunder_vars
 
 def print_dunder_vars(filename) -> str:
-    print_trace(f"At {sys._getframe().f_code.co_name}() within {filename}:")
+    print_trace(f"At print_dunder_vars() within {filename}:")
     try:
         dunder_vars = _extract_dunder_variables(filename)
         if not dunder_vars:
@@ -1446,13 +1657,13 @@ def print_dunder_vars(filename) -> str:
                 print(f"{name} = {repr(value)}")
     
     except FileNotFoundError:
-        print(f"{sys._getframe().f_code.co_name}() Error: File '{filename}' not found!")
+        print(f"print_dunder_vars() Error: File '{filename}' not found!")
         sys.exit(1)
     except SyntaxError as e:
-        print(f"{sys._getframe().f_code.co_name}()Error: Invalid Python syntax in '{filename}': {e}")
+        print(f"print_dunder_vars()Error: Invalid Python syntax in '{filename}': {e}")
         sys.exit(1)
     except Exception as e:
-        print(f"{sys._getframe().f_code.co_name}() Error: {e}! ")
+        print(f"print_dunder_vars() Error: {e}! ")
         sys.exit(1)
 
 
@@ -1469,7 +1680,7 @@ def get_api_key(app_id: str, account_name: str) -> str:
     if is_macos():
         # Pull sd_api_key as password from macOS Keyring file (and other password manager):
         try:
-            #import keyring
+            import keyring
             api_key = keyring.get_password(app_id,account_name)
             if api_key:
                 print_trace("get_api_key() len(api_key)="+str(len(api_key))+" chars.")
@@ -1479,10 +1690,10 @@ def get_api_key(app_id: str, account_name: str) -> str:
                 print_error("get_api_key() api_key=None")
                 return None
         except Exception as e:
-            print_error(f"{sys._getframe().f_code.co_name}(): str({e})")
+            print_error(f"get_api_key(): str({e})")
             return None
     else:
-        print_error(f"{sys._getframe().f_code.co_name}(): not macOS. Obtain key from .env file?")
+        print_error("get_api_key(): not macOS. Obtain key from .env file?")
     
     return None
 
@@ -1504,7 +1715,7 @@ def list_disk_space_by_device() -> None:
             # Check if the volume is removable
             cmd = f"diskutil info {partition.device}"
             output = subprocess.check_output(cmd, shell=True).decode('utf-8')
-            print_verbose(f"{sys._getframe().f_code.co_name}(): output: \"{output}\" ")
+            print_verbose(f"list_disk_space_by_device(): output: \"{output}\" ")
             #if "Removable Media: Yes" in output:
             # FIXME:
             #    removable_volumes.append(partition.mountpoint)
@@ -1591,7 +1802,7 @@ def read_file_from_removable_drive(drive_path: str, file_name: str, content: str
 
     # import pathlib
     path = pathlib.Path(global_env_path)
-    print_verbose(f"{sys._getframe().f_code.co_name}(): \"{path}\" ")
+    print_verbose(f"read_file_from_removable_drive(): \"{path}\" ")
     # Based on: pip3 install python-dotenv
     # from dotenv import load_dotenv
        # See https://www.python-engineer.com/posts/dotenv-python/
@@ -1653,6 +1864,7 @@ def eject_drive(drive_path: str) -> None:
 
 
 def shorten_url(long_url: str) -> str:
+    import requests
     base_url = 'http://tinyurl.com/api-create.php?url='
     response = requests.get(base_url + long_url)
     print_trace(f"shorten_url() {response.text}")
@@ -1690,23 +1902,35 @@ def reverse_words(input_str: str) -> str:
     >>> reverse_words(sentence)
     'Python love I'
     """
-    return " ".join(reversed(input_str.split(" ")))
+    return " ".join(input_str.split()[::-1])
 
 
 #### Numeric utilities
 
 
+# Decimal or scientific notation, checked without raising an exception on misses:
+_NUM_RE = re.compile(r'[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+
 def is_number(s) -> bool:
+    """True for text like "42", "-3.5", ".5", "1e-3" (surrounding whitespace allowed),
+    and for non-text values float() accepts (int, float, Decimal).
+    Text such as "nan", "inf" or "1_000" is not treated as a number.
+    """
+    if isinstance(s, str):
+        return _NUM_RE.fullmatch(s.strip()) is not None
     try:
         float(s)
         return True
-    except ValueError:
+    except (TypeError, ValueError):
         return False
 
 
 #### Encryption/Decrpytion of secrets
 
 
+# Alphabet for gen_random_alphanumeric(), built once:
+_ALNUM_CHARS = string.ascii_lowercase + string.digits
+
 def gen_random_alphanumeric(length=12):
     """
     Generate a cryptographically secure random alphanumeric string.
@@ -1717,10 +1941,8 @@ def gen_random_alphanumeric(length=12):
     Returns:
         str: Secure random alphanumeric string
     """
-    #import string
-    characters = string.ascii_lowercase + string.digits
     #import secrets
-    return ''.join(secrets.choice(characters) for _ in range(length))
+    return ''.join(secrets.choice(_ALNUM_CHARS) for _ in range(length))
     # WARNING: Avoid printing out secret values.
 
 
@@ -1732,28 +1954,35 @@ def is_within_git_folder(output_dir: str) -> bool:
     # Substitute tilde (~) in first character of output_dir with User's home directory:
     if output_dir[0] == "~":
         output_dir = str(Path.home()) + output_dir[1:]
-        print_verbose(f"{sys._getframe().f_code.co_name}(): output_dir: \"{output_dir}\"")
+        print_verbose(f"is_within_git_folder(): output_dir: \"{output_dir}\"")
 
     # from pathlib import Path:
     output_dir = Path(output_dir).resolve()
     if output_dir.name == '.git' and output_dir.is_dir():
-        print_fail(f"{sys._getframe().f_code.co_name}(): output_dir: \"{output_dir}\" contains a .git directory!")
+        print_fail(f"is_within_git_folder(): output_dir: \"{output_dir}\" contains a .git directory!")
         return True
     # Check each parent directory for .git folder:
     for parent in [output_dir] + list(output_dir.parents):
         git_path = parent / '.git'
         if git_path.exists() and git_path.is_dir():
-            print_fail(f"{sys._getframe().f_code.co_name}(): {output_dir} is under .git folder: \"{git_path}\" ")
+            print_fail(f"is_within_git_folder(): {output_dir} is under .git folder: \"{git_path}\" ")
             return True
     return False
 
 
-def generate_rsa_keypair(key_size=2048, save_to_files=True, output_dir="~/.keys"):
+# Stateless serialization option shared by every generate_keypair() call:
+_NO_ENC = serialization.NoEncryption()
+
+def generate_keypair(algo="rsa3072", save_to_files=True, output_dir="~/.keys"):
     """
-    Generate RSA private/public key pair
+    Generate private/public key pair
     private_key.pem & public_key.pem
     Args:
-        key_size (int): Size of the RSA key (default: 2048)
+        algo (str): "rsa3072" (default), "rsa2048", "rsa4096" (or other "rsa" + bits),
+            "ed25519" or "ecdsa_p256".
+            RSA key generation searches for large primes, so time grows steeply with size
+            (4096 is several times slower than 3072). Ed25519 and ECDSA P-256 are near-instant,
+            but Google service account keys must be RSA.
         save_to_files (bool): Whether to save keys to files
         output_dir (str): Directory to save key files,
         where "~/.keys" is a hidden folder in the user's home directory.
@@ -1763,11 +1992,19 @@ def generate_rsa_keypair(key_size=2048, save_to_files=True, output_dir="~/.keys"
     if is_within_git_folder(output_dir):
         exit(9)
 
-    # Generate private key:
-    private_key = rsa.generate_private_key(
-        public_exponent=65537,
-        key_size=key_size,
-    )
+    # Generate private key (cryptography calls OpenSSL's C key generation, not Python bignum code):
+    if algo.startswith("rsa") and algo[3:].isdigit():
+        private_key = rsa.generate_private_key(
+            public_exponent=65537,   # small Hamming weight for cheap public-key operations
+            key_size=int(algo[3:]),
+        )
+    elif algo == "ed25519":
+        private_key = ed25519.Ed25519PrivateKey.generate()
+    elif algo == "ecdsa_p256":
+        private_key = ec.generate_private_key(ec.SECP256R1())
+    else:
+        print_fail(f"generate_keypair(): algo \"{algo}\" not one of rsa2048, rsa3072, rsa4096, ed25519, ecdsa_p256")
+        return None, None
     
     # Get public key from private key:
     public_key = private_key.public_key()
@@ -1776,7 +2013,7 @@ def generate_rsa_keypair(key_size=2048, save_to_files=True, output_dir="~/.keys"
     private_pem = private_key.private_bytes(
         encoding=serialization.Encoding.PEM,
         format=serialization.PrivateFormat.PKCS8,
-        encryption_algorithm=serialization.NoEncryption()
+        encryption_algorithm=_NO_ENC
     )
     
     # Serialize public key to PEM format:
@@ -1789,18 +2026,23 @@ def generate_rsa_keypair(key_size=2048, save_to_files=True, output_dir="~/.keys"
         # Create output directory if it doesn't exist
         os.makedirs(output_dir, exist_ok=True)
         
-        # Save private key
+        # Save private key, created readable only by owner (no window before a chmod).
+        # Written to a temp file then renamed, so a crash never leaves a partial PEM for readers:
         private_key_path = os.path.join(output_dir, "private_key.pem")
-        with open(private_key_path, "wb") as f:
-            f.write(private_pem)
+        tmp_path = private_key_path + ".tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        try:
+            os.write(fd, private_pem)   # one write(2) for the whole PEM
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.chmod(tmp_path, 0o600)   # in case a stale temp file already existed
+        os.replace(tmp_path, private_key_path)   # atomic on POSIX and Windows
         
         # Save public key
         public_key_path = os.path.join(output_dir, "public_key.pem")
         with open(public_key_path, "wb") as f:
             f.write(public_pem)
-        
-        # Set appropriate file permissions (readable only by owner)
-        os.chmod(private_key_path, 0o600)
         os.chmod(public_key_path, 0o644)
         
         print(f"Private key saved to: {private_key_path}")
@@ -1809,6 +2051,44 @@ def generate_rsa_keypair(key_size=2048, save_to_files=True, output_dir="~/.keys"
     return private_pem, public_pem
 
 
+def keypair_matches_algo(private_pem, algo="rsa3072") -> bool:
+    """
+    Whether an unencrypted private key PEM is of the type generate_keypair() makes for algo,
+    so a stored key can be reused only for the algo asked for (e.g. not a 3072-bit key for "rsa4096").
+    Args:
+        private_pem (bytes): Private key PEM, as returned by generate_keypair()
+        algo (str): Same values as generate_keypair()
+    Returns:
+        bool: False also if the PEM cannot be loaded
+    """
+    try:
+        private_key = serialization.load_pem_private_key(private_pem, password=None)
+    except (ValueError, TypeError):
+        return False
+    if algo.startswith("rsa") and algo[3:].isdigit():
+        return isinstance(private_key, rsa.RSAPrivateKey) and private_key.key_size == int(algo[3:])
+    if algo == "ed25519":
+        return isinstance(private_key, ed25519.Ed25519PrivateKey)
+    if algo == "ecdsa_p256":
+        return isinstance(private_key, ec.EllipticCurvePrivateKey) and isinstance(private_key.curve, ec.SECP256R1)
+    return False
+
+
+def generate_rsa_keypair(key_size=2048, save_to_files=True, output_dir="~/.keys"):
+    """
+    Generate RSA private/public key pair
+    private_key.pem & public_key.pem
+    Args:
+        key_size (int): Size of the RSA key (default: 2048)
+        save_to_files (bool): Whether to save keys to files
+        output_dir (str): Directory to save key files,
+        where "~/.keys" is a hidden folder in the user's home directory.
+    Returns:
+        tuple: (private_key_pem, public_key_pem) as bytes
+    """
+    return generate_keypair(f"rsa{key_size}", save_to_files=save_to_files, output_dir=output_dir)
+
+
 def generate_encrypted_keypair(password, key_size=2048, output_dir="~/.keys"):
     """
     Generate RSA key pair with encrypted private key
@@ -1871,18 +2151,18 @@ def read_file_to_string(file_path):
     """Returns the text contents of a file, as a string.
     """
     if not file_path:
-        print_error(f"{sys._getframe().f_code.co_name}(): file_path is needed but not provided.")
+        print_error("read_file_to_string(): file_path is needed but not provided.")
         return None
     try:
         with open(file_path, 'r', encoding='utf-8') as file:
             text_content = file.read()
-        print_verbose(f"{sys._getframe().f_code.co_name}(): \"{len(text_content)}\" chars in \"{file_path}\" ")
+        print_verbose(f"read_file_to_string(): \"{len(text_content)}\" chars in \"{file_path}\" ")
         return text_content
     except FileNotFoundError:
-        print_error(f"{sys._getframe().f_code.co_name}(): File \"{file_path}\" not found")
+        print_error(f"read_file_to_string(): File \"{file_path}\" not found")
         return None
     except Exception as e:
-        print_error(f"{sys._getframe().f_code.co_name}(): {e}")
+        print_error(f"read_file_to_string(): {e}")
         return None
 
 
@@ -1893,14 +2173,14 @@ def delete_all_files_in_folder(folder_path):
         for file_path in folder.iterdir():
             if file_path.is_file():
                 file_path.unlink()
-                print_trace(f"{sys._getframe().f_code.co_name}(): Deleted: {file_path.name}")
-        print_verbose(f"{sys._getframe().f_code.co_name}(): All files deleted from {folder_path}")
+                print_trace(f"delete_all_files_in_folder(): Deleted: {file_path.name}")
+        print_verbose(f"delete_all_files_in_folder(): All files deleted from {folder_path}")
     except FileNotFoundError:
-        print(f"{sys._getframe().f_code.co_name}(): Folder not found: {folder_path}")
+        print(f"delete_all_files_in_folder(): Folder not found: {folder_path}")
     except PermissionError:
-        print(f"{sys._getframe().f_code.co_name}(): Permission denied: {folder_path}")
+        print(f"delete_all_files_in_folder(): Permission denied: {folder_path}")
     except Exception as e:
-        print(f"{sys._getframe().f_code.co_name}(): {e}")
+        print(f"delete_all_files_in_folder(): {e}")
 
 
 def hash_file_sha256(filename: str) -> str:
@@ -1991,10 +2271,9 @@ def encrypt_file(file_path: str) -> bool:
         pyAesCrypt.decryptFile("data.txt.aes", "dataout.txt", password)
     """
     # import os, import shutil import datetime
-    # import pyAesCrypt
     print_verbose("encrypt_file() "+file_path)
     try:
-        # import pyAesCrypt
+        import pyAesCrypt
         pyAesCrypt.encryptFile(file_path, file_path + ".aes")
     except Exception as e:
         print_error("encrypt_file() exception: "+str(e))
@@ -2007,10 +2286,9 @@ def encrypt_file(file_path: str) -> bool:
 def decrypt_file(file_path: str) -> bool:
     """Decrypt a file using AES-256 encryption."""
     # import os, import shutil import datetime
-    # import pyAesCrypt
     print_verbose("decrypt_file() "+file_path)
     try:
-        # import pyAesCrypt
+        import pyAesCrypt
         pyAesCrypt.decryptFile(file_path, file_path[:-4])
     except Exception as e:
         print_error("decrypt_file() exception: "+str(e))
@@ -2027,18 +2305,18 @@ def save_key_in_keychain(svc: str, acct: str, key: str) -> bool:
     2. encrypt(my_secret_key)
     3. save_key_in_keychain("pgm", "mondrian", "my-secret-key")
     """
-    print_verbose(f"{sys._getframe().f_code.co_name}(): {svc} {acct} len={str(len(key))} ")
-    # import keyring
+    print_verbose(f"save_key_in_keychain(): {svc} {acct} len={str(len(key))} ")
+    import keyring
     keyring.set_password(svc, acct, key)
 
     # Retrieve a password:
     retrieved_key = keyring.get_password(svc, acct)
     if retrieved_key != key:
-        print_error(f"{sys._getframe().f_code.co_name}(): key not found in Keychain.")
+        print_error("save_key_in_keychain(): key not found in Keychain.")
         return False
     else:
         # WARNING: Do not expose secret info using print:
-        print_verbose(f"{sys._getframe().f_code.co_name}(): {len(retrieved_key)} chars.")
+        print_verbose(f"save_key_in_keychain(): {len(retrieved_key)} chars.")
         return True
 
 
@@ -2059,7 +2337,7 @@ def send_smtp() -> bool:
     """
     password = get_api_key("gmail",EMAIL_FROM)  # loadtesters
     if not password:
-        print_fail(f"{sys._getframe().f_code.co_name}(): password needed.")
+        print_fail("send_smtp(): password needed.")
         exit(9)
 
     recipients = EMAIL_TO  # Recipients as a list: "[ 1@example.com, 2@example.com ]"
@@ -2102,7 +2380,7 @@ def gen_qrcode(url: str,qrcode_file_path: str) -> bool:
 
     print_verbose("gen_qrcode() url="+url+" qrcode_file_path="+qrcode_file_path)
     try:
-        #import qrcode  with higher level of error correction
+        import qrcode  # with higher level of error correction
         qr = qrcode.QRCode(version=2, 
             error_correction=qrcode.constants.ERROR_CORRECT_H, 
             box_size=10, border=5)
@@ -0,0 +1,45 @@
+"""Tests for gcp-services.py, loaded by file path since its name is not importable."""
+import contextlib
+import importlib.util
+import io
+import sys
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+REPO_DIR = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(scope="module")
+def gcp():
+    """gcp-services.py as a module, imported with no command-line arguments."""
+    sys.path.insert(0, str(REPO_DIR))
+    with mock.patch.object(sys, "argv", ["gcp-services.py"]), contextlib.redirect_stdout(io.StringIO()):
+        spec = importlib.util.spec_from_file_location("gcp_services", REPO_DIR / "gcp-services.py")
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    return module
+
+
+def test_check_install_packages_installs_when_parent_package_missing(gcp, tmp_path):
+    """find_spec("google.cloud.storage") raises if google.cloud itself is missing."""
+    with mock.patch.object(gcp.Path, "home", return_value=tmp_path), \
+            mock.patch.object(gcp.importlib.util, "find_spec",
+                              side_effect=ModuleNotFoundError("No module named 'google.cloud'")), \
+            mock.patch.object(gcp.subprocess, "run") as run:
+        assert gcp.check_install_packages() is True
+    run.assert_called_once()
+    assert "google-cloud-storage" in run.call_args.args[0]
+
+
+def test_get_secrets_bulk_accepts_generator(gcp):
+    """secret_ids is read by executor.map() and again to key the result."""
+    client = mock.Mock()
+    client.access_secret_version.side_effect = lambda request: mock.Mock(
+        payload=mock.Mock(data=request["name"].split("/")[3].encode("UTF-8")))
+    with mock.patch.object(gcp, "_get_secret_client", return_value=client):
+        secrets = gcp.get_secrets_bulk("my-project", (secret_id for secret_id in ["a", "b"]))
+    assert secrets == {"a": "a", "b": "b"}
+    client.access_secret_version.assert_any_call(
+        request={"name": "projects/my-project/secrets/a/versions/latest"})